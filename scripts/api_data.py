@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Shared access to the parse_api_docs.py output directory (data/api).
+
+Tools that consume the parsed API import their file names and loaders from
+here, so the preference for the resolved model (merged.json) over the
+per-API files lives in one place.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+
+API_FILES = ['enfusion.json', 'arma-reforger.json']
+MERGED_FILE = 'merged.json'
+OVERLOADS_FILE = 'overloads.json'
+TYPE_REFERENCES_FILE = 'type-references.json'
+
+
+def api_source_files(api_dir: Path) -> List[Path]:
+    """Files holding class records: merged.json if present, else the per-API files."""
+    merged = api_dir / MERGED_FILE
+    if merged.exists():
+        return [merged]
+    return [api_dir / filename for filename in API_FILES]
+
+
+def load_api_classes(api_dir: Path) -> List[dict]:
+    """
+    Load class records, preferring the resolved model.
+
+    When falling back to the per-API files, a class documented by both is
+    kept once; the first definition wins (Enfusion before Arma Reforger).
+    """
+    classes = {}
+    for path in api_source_files(api_dir):
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                for cls in json.load(f):
+                    classes.setdefault(cls['name'], cls)
+    return list(classes.values())
+
+
+def load_index(api_dir: Path, filename: str) -> Optional[dict]:
+    """Load one of the generated index files, or None if it hasn't been generated."""
+    path = api_dir / filename
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def describe_overload(method: dict) -> dict:
+    """Reduce a parsed method to what call-site resolution needs."""
+    params = []
+    min_arity = 0
+    for i, param in enumerate(method.get('parameters', [])):
+        modifiers = param.get('modifiers', [])
+        optional = 'default' in param
+        params.append({
+            "type": param['type'],
+            "optional": optional,
+            "out": 'out' in modifiers,
+            "inout": 'inout' in modifiers,
+        })
+        if not optional:
+            min_arity = i + 1
+    return {
+        "returnType": method['returnType'],
+        "static": method.get('static', False),
+        "minArity": min_arity,
+        "maxArity": len(params),
+        "parameters": params,
+    }
+
+
+def hide_overloads(chain: Iterable[Tuple[str, List[dict]]]) -> List[dict]:
+    """
+    Merge (declaring class, overloads) pairs, most derived class first.
+
+    An overload redeclared in a subclass with the same parameter types hides
+    the parent's. Each result carries its declaring class as 'declaredIn'.
+    """
+    resolved = []
+    hidden = set()
+    for owner, own in chain:
+        signatures = set()
+        for overload in own:
+            signature = tuple(p['type'] for p in overload['parameters'])
+            if signature not in hidden:
+                resolved.append(dict(overload, declaredIn=owner))
+            signatures.add(signature)
+        hidden |= signatures
+    return resolved
+
+
+def resolve_overloads(overloads: dict, class_name: str, method_name: str) -> List[dict]:
+    """List every overload of a method callable on a class, using overloads.json."""
+    declared = overloads['declared']
+    return hide_overloads(
+        (owner, declared.get(owner, {}).get(method_name, []))
+        for owner in overloads['ancestry'].get(class_name, [])
+    )
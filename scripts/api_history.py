@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Delta-compressed history of parsed API snapshots across game versions.
+
+Each recorded version is stored as a map of class name -> content hash.
+Class records are content-addressed objects, so a class that is unchanged
+between patches is stored once. Version maps are written as deltas against
+the previous version, with a full base every few versions so any version
+can be rebuilt by replaying a handful of deltas.
+
+An index kept alongside answers "when did Class.Method appear or change
+signature" directly, without replaying snapshots.
+
+Examples:
+  python scripts/api_history.py record --version 1.2.0.76
+  python scripts/api_history.py history BaseWorld.QueryEntitiesBySphere
+  python scripts/api_history.py restore --version 1.2.0.76 --output /tmp/api
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from api_data import MERGED_FILE, load_api_classes
+
+
+# A full version map is written every KEYFRAME_INTERVAL versions; the rest
+# are deltas, so rebuilding replays at most KEYFRAME_INTERVAL - 1 of them
+KEYFRAME_INTERVAL = 10
+
+# Version labels become file names under versions/, so only allow characters
+# that are safe on every platform and can't escape the store
+VERSION_LABEL_RE = re.compile(r'[A-Za-z0-9_.-]+')
+
+
+def check_version_label(version: str) -> str:
+    """Return the label unchanged, or raise ValueError if it isn't a safe file name."""
+    if not VERSION_LABEL_RE.fullmatch(version) or set(version) == {'.'}:
+        raise ValueError(f"Invalid version label '{version}': use letters, digits, '.', '_' and '-'")
+    return version
+
+
+def record_hash(record: dict) -> str:
+    """Content address of a class record, independent of key order."""
+    encoded = json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def method_signature(method: dict) -> str:
+    """Render a method's signature for change detection."""
+    params = []
+    for param in method.get('parameters', []):
+        text = ' '.join(param.get('modifiers', []) + [param['type']])
+        if 'default' in param:
+            text += ' = ' + param['default']
+        params.append(text)
+    prefix = 'static ' if method.get('static') else ''
+    return f"{prefix}{method['returnType']} {method['name']}({', '.join(params)})"
+
+
+def method_signatures(record: dict) -> Dict[str, str]:
+    """Map method name -> signature(s); overloads are joined in sorted order."""
+    by_name: Dict[str, List[str]] = {}
+    for method in record.get('methods', []):
+        by_name.setdefault(method['name'], []).append(method_signature(method))
+    return {name: ' | '.join(sorted(sigs)) for name, sigs in by_name.items()}
+
+
+class SnapshotStore:
+    """On-disk store: objects/, versions/ and index.json under one root."""
+
+    def __init__(self, root: Path, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.root = root
+        self.keyframe_interval = keyframe_interval
+        self.index_path = root / 'index.json'
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {"versions": [], "classes": {}, "methods": {}}
+        self._maps: Dict[str, Dict[str, str]] = {}
+
+    # Objects
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / f"{digest}.json.gz"
+
+    def put_object(self, record: dict) -> str:
+        """Store a class record once; returns its content hash."""
+        digest = record_hash(record)
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = json.dumps(record, separators=(',', ':')).encode('utf-8')
+            with gzip.open(path, 'wb') as f:
+                f.write(data)
+        return digest
+
+    def get_object(self, digest: str) -> dict:
+        with gzip.open(self._object_path(digest), 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+
+    # Version maps
+
+    def _version_path(self, version: str) -> Path:
+        check_version_label(version)
+        return self.root / 'versions' / f"{version}.json"
+
+    def _read_version(self, version: str) -> dict:
+        with open(self._version_path(version), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def class_map(self, version: str) -> Dict[str, str]:
+        """Rebuild the class name -> hash map of a version."""
+        if version in self._maps:
+            return self._maps[version]
+        if version not in self.index['versions']:
+            raise KeyError(f"Unknown version '{version}'")
+
+        # Walk back to the nearest base, then replay deltas forward
+        chain = []
+        entry = self._read_version(version)
+        while 'base' not in entry:
+            chain.append(entry)
+            entry = self._read_version(entry['parent'])
+        classes = dict(entry['base'])
+        for delta in reversed(chain):
+            for name in delta['removed']:
+                classes.pop(name, None)
+            classes.update(delta['changed'])
+
+        self._maps[version] = classes
+        return classes
+
+    def restore(self, version: str) -> List[dict]:
+        """Return the full class list of a recorded version."""
+        return [self.get_object(digest) for digest in self.class_map(version).values()]
+
+    # Recording
+
+    def record(self, version: str, classes: List[dict]) -> dict:
+        """
+        Record a parse run as a new version.
+
+        Returns counts of added, changed, removed and unchanged classes.
+        """
+        check_version_label(version)
+        versions = self.index['versions']
+        if version in versions:
+            raise ValueError(f"Version '{version}' is already recorded")
+
+        current = {cls['name']: self.put_object(cls) for cls in classes}
+        previous_version = versions[-1] if versions else None
+        previous = self.class_map(previous_version) if previous_version else {}
+
+        changed = {name: digest for name, digest in current.items() if previous.get(name) != digest}
+        removed = sorted(name for name in previous if name not in current)
+
+        if previous_version is None or len(versions) % self.keyframe_interval == 0:
+            entry = {"base": current}
+        else:
+            entry = {"parent": previous_version, "changed": changed, "removed": removed}
+
+        path = self._version_path(version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, separators=(',', ':'))
+
+        self._update_index(version, previous, changed, removed)
+        versions.append(version)
+        self._maps[version] = current
+        self._save_index()
+
+        added = sum(1 for name in changed if name not in previous)
+        return {
+            "added": added,
+            "changed": len(changed) - added,
+            "removed": len(removed),
+            "unchanged": len(current) - len(changed),
+        }
+
+    def _update_index(self, version: str, previous: Dict[str, str],
+                      changed: Dict[str, str], removed: List[str]):
+        """Append class and method events; only touched classes are loaded."""
+        class_events = self.index['classes']
+        method_events = self.index['methods']
+
+        def method_event(key: str, event: str, signature: Optional[str]):
+            method_events.setdefault(key, []).append(
+                {"version": version, "event": event, "signature": signature})
+
+        for name, digest in changed.items():
+            old_methods = method_signatures(self.get_object(previous[name])) if name in previous else {}
+            new_methods = method_signatures(self.get_object(digest))
+            class_events.setdefault(name, []).append(
+                {"version": version, "event": "changed" if name in previous else "added"})
+
+            for method, signature in new_methods.items():
+                if method not in old_methods:
+                    method_event(f"{name}.{method}", "added", signature)
+                elif old_methods[method] != signature:
+                    method_event(f"{name}.{method}", "changed", signature)
+            for method in old_methods:
+                if method not in new_methods:
+                    method_event(f"{name}.{method}", "removed", None)
+
+        for name in removed:
+            class_events.setdefault(name, []).append({"version": version, "event": "removed"})
+            for method in method_signatures(self.get_object(previous[name])):
+                method_event(f"{name}.{method}", "removed", None)
+
+    def _save_index(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, separators=(',', ':'))
+        tmp.replace(self.index_path)
+
+    # Queries
+
+    def history(self, key: str) -> List[dict]:
+        """Events for 'Class.Method' (method history) or 'Class' (class history)."""
+        if key in self.index['methods']:
+            return self.index['methods'][key]
+        return self.index['classes'].get(key, [])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Record and query API snapshots across game versions',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Examples:')[1]
+    )
+    parser.add_argument('--store', type=str, default='data/api-history',
+                       help='Snapshot store directory (default: data/api-history)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help='Record the current parsed API as a version')
+    rec.add_argument('--version', required=True, help='Game version label, e.g. 1.2.0.76')
+    rec.add_argument('--api', type=str, default='data/api',
+                     help='Directory with parsed API JSON files (default: data/api)')
+
+    res = sub.add_parser('restore', help='Write a recorded version back out as merged.json')
+    res.add_argument('--version', required=True)
+    res.add_argument('--output', type=str, required=True)
+
+    hist = sub.add_parser('history', help='Show when a class or Class.Method appeared or changed')
+    hist.add_argument('key', help="'Class' or 'Class.Method'")
+
+    sub.add_parser('list', help='List recorded versions')
+
+    args = parser.parse_args()
+    store = SnapshotStore(Path(args.store))
+
+    if args.command == 'record':
+        classes = load_api_classes(Path(args.api))
+        if not classes:
+            print(f"Error: no API data in {args.api}. Run scripts/parse_api_docs.py first.")
+            sys.exit(1)
+        try:
+            counts = store.record(args.version, classes)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Recorded {args.version}: {counts['added']} added, {counts['changed']} changed, "
+              f"{counts['removed']} removed, {counts['unchanged']} unchanged")
+
+    elif args.command == 'restore':
+        try:
+            classes = store.restore(args.version)
+        except (KeyError, ValueError) as e:
+            print(f"Error: {e.args[0]}")
+            sys.exit(1)
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / MERGED_FILE, 'w', encoding='utf-8') as f:
+            json.dump(classes, f, indent=2)
+        print(f"Restored {len(classes)} classes to {output_dir / MERGED_FILE}")
+
+    elif args.command == 'history':
+        events = store.history(args.key)
+        if not events:
+            print(f"No history for '{args.key}'")
+            sys.exit(1)
+        for event in events:
+            signature = event.get('signature')
+            print(f"{event['version']:16} {event['event']:8} {signature or ''}".rstrip())
+
+    elif args.command == 'list':
+        for version in store.index['versions']:
+            print(version)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory model for parsed API classes.
+
+parse_api_docs.py emits one dict per class, method and parameter, repeating
+keys such as "returnType" and "access" and storing identical type strings
+as separate objects. This module holds the same data in __slots__ records
+with interned names and types, and converts losslessly to and from the JSON
+shape, so long-running tools can keep both APIs resident cheaply.
+
+Run directly to compare the footprint of both representations:
+
+    python scripts/api_model.py --measure
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from api_data import api_source_files, load_api_classes
+
+
+_intern = sys.intern
+
+
+def _intern_opt(value: Optional[str]) -> Optional[str]:
+    return _intern(value) if isinstance(value, str) else value
+
+
+def _extra(data: dict, known: frozenset) -> Optional[Dict[str, Any]]:
+    """Collect keys the model has no slot for, so round-trips stay lossless."""
+    extra = {k: v for k, v in data.items() if k not in known}
+    return extra or None
+
+
+class Parameter:
+    """A method parameter."""
+
+    __slots__ = ('name', 'type', 'modifiers', 'default', 'extra')
+
+    KEYS = frozenset(('name', 'type', 'modifiers', 'default'))
+
+    def __init__(self, name: str, type: str, modifiers: Optional[Tuple[str, ...]] = None,
+                 default: Optional[str] = None, extra: Optional[dict] = None):
+        self.name = name
+        self.type = type
+        self.modifiers = modifiers
+        self.default = default
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Parameter':
+        return cls(
+            _intern(data['name']),
+            _intern(data['type']),
+            tuple(_intern(m) for m in data['modifiers']) if 'modifiers' in data else None,
+            data.get('default'),
+            _extra(data, cls.KEYS),
+        )
+
+    def to_dict(self) -> dict:
+        data = {"name": self.name, "type": self.type}
+        if self.modifiers is not None:
+            data['modifiers'] = list(self.modifiers)
+        if self.default is not None:
+            data['default'] = self.default
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class Method:
+    """A class method."""
+
+    __slots__ = ('name', 'return_type', 'parameters', 'static', 'access', 'description', 'extra')
+
+    KEYS = frozenset(('name', 'returnType', 'parameters', 'static', 'access', 'description'))
+
+    def __init__(self, name: str, return_type: str, parameters: Tuple[Parameter, ...],
+                 static: bool, access: str, description: str, extra: Optional[dict] = None):
+        self.name = name
+        self.return_type = return_type
+        self.parameters = parameters
+        self.static = static
+        self.access = access
+        self.description = description
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Method':
+        return cls(
+            _intern(data['name']),
+            _intern(data['returnType']),
+            tuple(Parameter.from_dict(p) for p in data['parameters']),
+            data['static'],
+            _intern(data['access']),
+            data['description'],
+            _extra(data, cls.KEYS),
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "name": self.name,
+            "returnType": self.return_type,
+            "parameters": [p.to_dict() for p in self.parameters],
+            "static": self.static,
+            "access": self.access,
+            "description": self.description,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class ApiClass:
+    """A documented script class."""
+
+    __slots__ = ('name', 'extends', 'module', 'methods', 'properties', 'description',
+                 'apis', 'content_hash', 'parent_api', 'extra')
+
+    KEYS = frozenset(('name', 'extends', 'module', 'methods', 'properties', 'description'))
+    # Written together by merge_api_sets(); kept in slots only when all are present
+    MERGE_KEYS = frozenset(('apis', 'contentHash', 'parentApi'))
+
+    def __init__(self, name: str, extends: Optional[str], module: str,
+                 methods: Tuple[Method, ...], properties: Tuple[Any, ...],
+                 description: str, extra: Optional[dict] = None,
+                 apis: Optional[Tuple[str, ...]] = None, content_hash: Optional[str] = None,
+                 parent_api: Optional[str] = None):
+        self.name = name
+        self.extends = extends
+        self.module = module
+        self.methods = methods
+        self.properties = properties
+        self.description = description
+        self.apis = apis
+        self.content_hash = content_hash
+        self.parent_api = parent_api
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ApiClass':
+        merged = cls.MERGE_KEYS.issubset(data)
+        return cls(
+            _intern(data['name']),
+            _intern_opt(data['extends']),
+            _intern(data['module']),
+            tuple(Method.from_dict(m) for m in data['methods']),
+            tuple(data['properties']),
+            data['description'],
+            _extra(data, cls.KEYS | cls.MERGE_KEYS if merged else cls.KEYS),
+            apis=tuple(_intern(a) for a in data['apis']) if merged else None,
+            content_hash=data['contentHash'] if merged else None,
+            parent_api=_intern_opt(data['parentApi']) if merged else None,
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "name": self.name,
+            "extends": self.extends,
+            "module": self.module,
+            "methods": [m.to_dict() for m in self.methods],
+            "properties": list(self.properties),
+            "description": self.description,
+        }
+        if self.apis is not None:
+            data['apis'] = list(self.apis)
+            data['contentHash'] = self.content_hash
+            data['parentApi'] = self.parent_api
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def from_json(classes: Iterable[dict]) -> List[ApiClass]:
+    """Convert parsed class dicts (the JSON shape) to model records."""
+    return [ApiClass.from_dict(c) for c in classes]
+
+
+def to_json(classes: Iterable[ApiClass]) -> List[dict]:
+    """Convert model records back to the JSON shape."""
+    return [c.to_dict() for c in classes]
+
+
+def load_api(api_dir: Path) -> List[ApiClass]:
+    """Load the parsed API from an output directory as model records, deduplicated by name."""
+    return from_json(load_api_classes(api_dir))
+
+
+def measure(api_dir: Path) -> Tuple[int, int]:
+    """
+    Measure resident size of the dict shape versus the model with tracemalloc.
+
+    Returns (dict_bytes, model_bytes) for the classes load_api() would keep.
+    """
+    tracemalloc.start()
+
+    base = tracemalloc.get_traced_memory()[0]
+    as_dicts = load_api_classes(api_dir)
+    dict_bytes = tracemalloc.get_traced_memory()[0] - base
+
+    # Build from fresh dicts so the model doesn't share strings with as_dicts;
+    # only what the model keeps alive once the dicts are freed is counted
+    del as_dicts
+    base = tracemalloc.get_traced_memory()[0]
+    parsed = load_api_classes(api_dir)
+    parsed.reverse()
+    model = []
+    while parsed:
+        model.append(ApiClass.from_dict(parsed.pop()))
+    model_bytes = tracemalloc.get_traced_memory()[0] - base
+
+    tracemalloc.stop()
+    del model
+    return dict_bytes, model_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact API model utilities')
+    parser.add_argument('--api', type=str, default='data/api',
+                       help='Directory with parsed API JSON files (default: data/api)')
+    parser.add_argument('--measure', action='store_true',
+                       help='Compare memory footprint of dicts vs the compact model')
+    parser.add_argument('--verify', action='store_true',
+                       help='Check that the loaded API files round-trip losslessly')
+    args = parser.parse_args()
+
+    api_dir = Path(args.api)
+    sources = [path for path in api_source_files(api_dir) if path.exists()]
+    if not sources:
+        print(f"Error: no API data in {api_dir}. Run scripts/parse_api_docs.py first.")
+        sys.exit(1)
+
+    if args.verify:
+        for path in sources:
+            with open(path, 'r', encoding='utf-8') as f:
+                classes = json.load(f)
+            ok = to_json(from_json(classes)) == classes
+            print(f"{path.name}: {'lossless' if ok else 'MISMATCH'}")
+            if not ok:
+                sys.exit(1)
+
+    if args.measure:
+        dict_bytes, model_bytes = measure(api_dir)
+        print(f"Dict representation:  {dict_bytes / 1024 / 1024:8.2f} MiB")
+        print(f"Compact model:        {model_bytes / 1024 / 1024:8.2f} MiB")
+        if dict_bytes:
+            print(f"Model uses {model_bytes / dict_bytes:.0%} of the dict footprint")
+
+    if not args.measure and not args.verify:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
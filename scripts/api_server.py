@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+Long-lived API lookup and validation server.
+
+Loads the parsed API JSON produced by parse_api_docs.py once and keeps it in
+memory, so editors and AI agents can issue class lookups, signature checks
+and file validation without paying Python startup and JSON load per call.
+
+Speaks line-delimited JSON-RPC 2.0 over stdio (default) or a Unix socket.
+Requests arriving concurrently are queued and handled in batches by a single
+worker; identical requests within a batch are answered once.
+"""
+
+import argparse
+import json
+import queue
+import re
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from api_data import (OVERLOADS_FILE, TYPE_REFERENCES_FILE, api_source_files,
+                      describe_overload, hide_overloads, load_index, resolve_overloads)
+from api_model import ApiClass, load_api
+
+
+# Batching defaults: how long the worker waits for more requests once the
+# first one arrives, and the most requests handled in one go
+BATCH_WINDOW = 0.002
+BATCH_MAX = 64
+
+# Lookup caches are keyed by client-supplied names; bound them so a
+# long-lived server doesn't grow without limit
+CACHE_SIZE = 4096
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def log(message: str):
+    """Log to stderr; stdout carries JSON-RPC replies in stdio mode."""
+    print(message, file=sys.stderr, flush=True)
+
+
+class ApiIndex:
+    """In-memory view of the parsed API with cached hierarchy lookups."""
+
+    def __init__(self, classes: List[ApiClass], overloads: Optional[dict] = None,
+                 type_references: Optional[Dict[str, list]] = None):
+        # Compact records (api_model) keep both APIs resident cheaply
+        self.classes: Dict[str, ApiClass] = {}
+        for cls in classes:
+            # First definition wins, matching lookup order Enfusion -> Arma
+            self.classes.setdefault(cls.name, cls)
+        # Per-class declared overloads plus flattened ancestry (overloads.json)
+        self.overloads = overloads
+        # Reverse type name -> (class, method, role) index (type-references.json)
+        self.type_references = type_references
+
+    @classmethod
+    def load(cls, api_dir: Path) -> 'ApiIndex':
+        """
+        Load parsed API data from an output directory.
+
+        Prefers the resolved model (merged.json) and falls back to the
+        per-API files written by older generator runs.
+        """
+        for path in api_source_files(api_dir):
+            log(f"Loading {path}" if path.exists() else f"Warning: {path} not found")
+        classes = load_api(api_dir)
+
+        overloads = load_index(api_dir, OVERLOADS_FILE)
+        if overloads is not None and 'declared' not in overloads:
+            # Flattened layout written by older generator runs
+            log(f"Warning: {api_dir / OVERLOADS_FILE} is outdated; re-run parse_api_docs.py")
+            overloads = None
+        type_references = load_index(api_dir, TYPE_REFERENCES_FILE)
+        for filename, index in ((OVERLOADS_FILE, overloads), (TYPE_REFERENCES_FILE, type_references)):
+            if index is not None:
+                log(f"Loaded {api_dir / filename}")
+        return cls(classes, overloads, type_references)
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def ancestry(self, class_name: str) -> Tuple[str, ...]:
+        """Return (class, parent, grandparent, ...) for a known class."""
+        chain = []
+        seen = set()
+        name = class_name
+        while name in self.classes and name not in seen:
+            chain.append(name)
+            seen.add(name)
+            name = self.classes[name].extends
+        return tuple(chain)
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def resolve_overloads(self, class_name: str, method_name: str) -> Tuple[dict, ...]:
+        """
+        Return every overload of a method callable on a class.
+
+        Uses the precomputed overload index when available; otherwise
+        derives the same answer from the class records.
+        """
+        if self.overloads is not None:
+            return tuple(resolve_overloads(self.overloads, class_name, method_name))
+        return tuple(hide_overloads(
+            (owner, [describe_overload(m.to_dict()) for m in self.classes[owner].methods if m.name == method_name])
+            for owner in self.ancestry(class_name)
+        ))
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def find_type_references(self, type_name: str, role: Optional[str]) -> Tuple[dict, ...]:
+        """
+        Return methods that use a type, optionally filtered by role.
+
+        role='producer' matches both ways of obtaining a value (return and out).
+        """
+        refs = self.type_references.get(type_name, [])
+        if role == 'producer':
+            return tuple(r for r in refs if r['role'] in ('return', 'out'))
+        if role is not None:
+            return tuple(r for r in refs if r['role'] == role)
+        return tuple(refs)
+
+    def cache_stats(self) -> dict:
+        """Combined hit/miss counters of the hierarchy, overload and type-reference caches."""
+        hits = misses = 0
+        for cached in (self.ancestry, self.resolve_overloads, self.find_type_references):
+            info = cached.cache_info()
+            hits += info.hits
+            misses += info.misses
+        return {"hits": hits, "misses": misses}
+
+
+class Metrics:
+    """Per-method request counters and latency statistics."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.methods: Dict[str, dict] = {}
+        self.batches = 0
+        self.batched_requests = 0
+        self.deduplicated = 0
+
+    def record(self, method: str, elapsed: float, error: bool = False):
+        with self.lock:
+            entry = self.methods.setdefault(method, {
+                "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0
+            })
+            elapsed_ms = elapsed * 1000
+            entry['count'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            if error:
+                entry['errors'] += 1
+
+    def record_batch(self, size: int, deduplicated: int):
+        with self.lock:
+            self.batches += 1
+            self.batched_requests += size
+            self.deduplicated += deduplicated
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            methods = {}
+            for name, entry in self.methods.items():
+                methods[name] = dict(entry)
+                methods[name]['avg_ms'] = entry['total_ms'] / entry['count']
+            return {
+                "methods": methods,
+                "batches": self.batches,
+                "avg_batch_size": (self.batched_requests / self.batches) if self.batches else 0.0,
+                "deduplicated": self.deduplicated,
+            }
+
+
+# Declarations and call sites recognised by validate_file
+CLASS_DECL_RE = re.compile(
+    r'^\s*(?:modded\s+|sealed\s+)*class\s+(\w+)(?:\s*:\s*(\w+)|\s+extends\s+(\w+))?', re.MULTILINE)
+STATIC_CALL_RE = re.compile(r'\b([A-Z]\w*)\.(\w+)\s*\(')
+LINE_COMMENT_RE = re.compile(r'//[^\n]*')
+BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+
+
+def strip_comments_and_strings(source: str) -> str:
+    """Blank out comments and string literals, keeping line numbers intact."""
+    def blank(match):
+        return re.sub(r'[^\n]', ' ', match.group(0))
+    source = BLOCK_COMMENT_RE.sub(blank, source)
+    source = LINE_COMMENT_RE.sub(blank, source)
+    return STRING_RE.sub(blank, source)
+
+
+class ApiServer:
+    """Dispatches JSON-RPC requests against a loaded ApiIndex."""
+
+    def __init__(self, index: ApiIndex):
+        self.index = index
+        self.metrics = Metrics()
+        self.handlers = {
+            'lookup_class': self.lookup_class,
+            'check_signature': self.check_signature,
+            'validate_file': self.validate_file,
+            'type_references': self.type_references,
+            'stats': self.stats,
+        }
+
+    def lookup_class(self, params: dict) -> Optional[dict]:
+        """Return a class record plus its resolved ancestry, or None."""
+        name = params.get('name')
+        if not isinstance(name, str):
+            raise RpcError(INVALID_PARAMS, "'name' must be a string")
+        cls = self.index.classes.get(name)
+        if cls is None:
+            return None
+        result = cls.to_dict()
+        result['ancestry'] = list(self.index.ancestry(name))
+        return result
+
+    def check_signature(self, params: dict) -> dict:
+        """Check that a method exists on a class and accepts an argument count."""
+        class_name = params.get('class')
+        method_name = params.get('method')
+        argc = params.get('argc')
+        if not isinstance(class_name, str) or not isinstance(method_name, str):
+            raise RpcError(INVALID_PARAMS, "'class' and 'method' must be strings")
+        if argc is not None and (not isinstance(argc, int) or isinstance(argc, bool)):
+            raise RpcError(INVALID_PARAMS, "'argc' must be an integer")
+
+        if class_name not in self.index.classes:
+            return {"valid": False, "reason": f"Unknown class '{class_name}'", "candidates": []}
+
+        candidates = list(self.index.resolve_overloads(class_name, method_name))
+        if not candidates:
+            return {"valid": False, "reason": f"'{class_name}' has no method '{method_name}'", "candidates": []}
+
+        if argc is not None:
+            matching = [c for c in candidates if c['minArity'] <= argc <= c['maxArity']]
+            if not matching:
+                return {
+                    "valid": False,
+                    "reason": f"No overload of '{class_name}.{method_name}' takes {argc} argument(s)",
+                    "candidates": candidates,
+                }
+            candidates = matching
+        return {"valid": True, "reason": "", "candidates": candidates}
+
+    def validate_file(self, params: dict) -> dict:
+        """
+        Validate API usage in an Enforce Script file.
+
+        Accepts either 'path' or 'source'. Reports unknown base classes and
+        static calls (Type.Method(...)) to methods a known class lacks.
+        """
+        source = params.get('source')
+        if source is None:
+            path = params.get('path')
+            if not isinstance(path, str):
+                raise RpcError(INVALID_PARAMS, "'path' or 'source' is required")
+            try:
+                source = Path(path).read_text(encoding='utf-8', errors='ignore')
+            except OSError as e:
+                raise RpcError(INVALID_PARAMS, f"Cannot read {path}: {e}")
+
+        code = strip_comments_and_strings(source)
+        declared = {m.group(1) for m in CLASS_DECL_RE.finditer(code)}
+        diagnostics = []
+
+        def line_of(pos: int) -> int:
+            return code.count('\n', 0, pos) + 1
+
+        for match in CLASS_DECL_RE.finditer(code):
+            # 'class A : B' and 'class A extends B' are both accepted
+            group = 2 if match.group(2) else 3
+            parent = match.group(group)
+            if parent and parent not in declared and parent not in self.index.classes:
+                diagnostics.append({
+                    "line": line_of(match.start(group)),
+                    "severity": "error",
+                    "message": f"Unknown base class '{parent}'",
+                })
+
+        for match in STATIC_CALL_RE.finditer(code):
+            class_name, method_name = match.group(1), match.group(2)
+            if class_name in declared or class_name not in self.index.classes:
+                continue
+            if not self.index.resolve_overloads(class_name, method_name):
+                diagnostics.append({
+                    "line": line_of(match.start(2)),
+                    "severity": "error",
+                    "message": f"'{class_name}' has no method '{method_name}'",
+                })
+
+        return {"diagnostics": diagnostics}
+
+    def type_references(self, params: dict) -> list:
+        """
+        List methods that use a type, optionally filtered by role.
+
+        Roles are 'return', 'out' and 'parameter'; pass role='producer' for
+        both ways of obtaining a value (return and out).
+        """
+        name = params.get('type')
+        role = params.get('role')
+        if not isinstance(name, str):
+            raise RpcError(INVALID_PARAMS, "'type' must be a string")
+        if role is not None and not isinstance(role, str):
+            raise RpcError(INVALID_PARAMS, "'role' must be a string")
+        if self.index.type_references is None:
+            raise RpcError(INTERNAL_ERROR, f"{TYPE_REFERENCES_FILE} not loaded; re-run parse_api_docs.py")
+        return list(self.index.find_type_references(name, role))
+
+    def stats(self, params: dict) -> dict:
+        """Return latency, batching and cache-hit metrics."""
+        result = self.metrics.snapshot()
+        result['cache'] = self.index.cache_stats()
+        result['classes'] = len(self.index.classes)
+        return result
+
+    def call(self, method: str, params: Any) -> Any:
+        """Invoke a handler, recording its latency."""
+        handler = self.handlers.get(method)
+        if handler is None:
+            raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        if params is None:
+            params = {}
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params must be an object")
+
+        start = time.perf_counter()
+        error = True
+        try:
+            result = handler(params)
+            error = False
+            return result
+        finally:
+            self.metrics.record(method, time.perf_counter() - start, error)
+
+    def handle_batch(self, requests: List[dict]) -> List[Optional[dict]]:
+        """
+        Handle a batch of decoded JSON-RPC requests.
+
+        Returns one reply per request, or None for notifications (no 'id').
+        Requests with identical method and params are evaluated once.
+        """
+        replies: List[Optional[dict]] = []
+        results: Dict[str, Tuple[bool, Any]] = {}
+        deduplicated = 0
+
+        for request in requests:
+            if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                    or not isinstance(request.get('method'), str):
+                replies.append(error_reply(None, INVALID_REQUEST, "Invalid Request"))
+                continue
+
+            method = request['method']
+            params = request.get('params')
+            key = json.dumps([method, params], sort_keys=True)
+            # Stats must reflect the moment they are asked for
+            if key in results and method != 'stats':
+                deduplicated += 1
+            else:
+                try:
+                    results[key] = (True, self.call(method, params))
+                except RpcError as e:
+                    results[key] = (False, (e.code, e.message))
+                except Exception as e:
+                    results[key] = (False, (INTERNAL_ERROR, f"{type(e).__name__}: {e}"))
+
+            if 'id' not in request:
+                replies.append(None)
+                continue
+            ok, value = results[key]
+            if ok:
+                replies.append({"jsonrpc": "2.0", "id": request['id'], "result": value})
+            else:
+                replies.append(error_reply(request['id'], *value))
+
+        self.metrics.record_batch(len(requests), deduplicated)
+        return replies
+
+
+def error_reply(request_id: Any, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class RequestBatcher:
+    """
+    Collects requests from concurrent clients and handles them in batches.
+
+    Each submitted request gets a Future resolved with its reply. A single
+    worker thread drains the queue, taking whatever is already queued and
+    waiting up to `window` seconds for more requests after the first arrives.
+    """
+
+    def __init__(self, server: ApiServer, window: float = BATCH_WINDOW, max_size: int = BATCH_MAX):
+        self.server = server
+        self.window = window
+        self.max_size = max_size
+        self.pending: 'queue.Queue[Tuple[dict, Future]]' = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def submit(self, request: dict) -> Future:
+        future: Future = Future()
+        self.pending.put((request, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self.pending.get()]
+            deadline = time.perf_counter() + self.window
+            while len(batch) < self.max_size:
+                try:
+                    # Requests already queued join without waiting
+                    batch.append(self.pending.get_nowait())
+                    continue
+                except queue.Empty:
+                    pass
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                replies = self.server.handle_batch([request for request, _ in batch])
+            except Exception as e:
+                for request, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), reply in zip(batch, replies):
+                future.set_result(reply)
+
+
+def process_line(line: str, batcher: RequestBatcher) -> Optional[str]:
+    """Decode one line (single request or JSON-RPC batch) and return the encoded reply."""
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        return json.dumps(error_reply(None, PARSE_ERROR, f"Parse error: {e}"))
+
+    if isinstance(message, list):
+        if not message:
+            return json.dumps(error_reply(None, INVALID_REQUEST, "Empty batch"))
+        futures = [batcher.submit(request) for request in message]
+        replies = [f.result() for f in futures]
+        replies = [r for r in replies if r is not None]
+        return json.dumps(replies) if replies else None
+
+    reply = batcher.submit(message).result()
+    return json.dumps(reply) if reply is not None else None
+
+
+def serve_stdio(batcher: RequestBatcher):
+    """Serve one request per line on stdin, replying on stdout."""
+    log("Serving JSON-RPC on stdio")
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        reply = process_line(line, batcher)
+        if reply is not None:
+            sys.stdout.write(reply + '\n')
+            sys.stdout.flush()
+
+
+def serve_unix_socket(batcher: RequestBatcher, socket_path: Path):
+    """Serve line-delimited JSON-RPC on a Unix socket, one thread per client."""
+    if not hasattr(socket, 'AF_UNIX'):
+        log("Error: Unix sockets are not supported on this platform; use stdio mode")
+        sys.exit(1)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                reply = process_line(line, batcher)
+                if reply is not None:
+                    self.wfile.write((reply + '\n').encode('utf-8'))
+                    self.wfile.flush()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    if socket_path.exists():
+        socket_path.unlink()
+    with Server(str(socket_path), Handler) as server:
+        log(f"Serving JSON-RPC on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if socket_path.exists():
+                socket_path.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve API lookups and validation from a warm in-memory index',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # JSON-RPC over stdio (for editor/agent integrations)
+  python scripts/api_server.py
+
+  # JSON-RPC over a Unix socket
+  python scripts/api_server.py --socket /tmp/enforce-api.sock
+
+Request example:
+  {"jsonrpc": "2.0", "id": 1, "method": "check_signature",
+   "params": {"class": "BaseWorld", "method": "QueryEntitiesBySphere", "argc": 3}}
+
+Methods: lookup_class, check_signature, validate_file, type_references, stats
+"""
+    )
+    parser.add_argument('--api', type=str, default='data/api',
+                       help='Directory with parsed API JSON files (default: data/api)')
+    parser.add_argument('--socket', type=str, default=None,
+                       help='Listen on this Unix socket path instead of stdio')
+    parser.add_argument('--batch-window', type=float, default=None,
+                       help=f'Milliseconds to wait for more requests per batch '
+                            f'(default: {BATCH_WINDOW * 1000:g} on a socket, 0 on stdio)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = ApiIndex.load(Path(args.api))
+    if not index.classes:
+        log(f"Error: no API data in {args.api}. Run scripts/parse_api_docs.py first.")
+        sys.exit(1)
+    log(f"Indexed {len(index.classes)} classes in {time.perf_counter() - start:.2f}s")
+
+    # The stdio reader waits for each reply before reading the next line, so
+    # no second request can arrive during the window; only sockets benefit
+    if args.batch_window is not None:
+        window = args.batch_window / 1000
+    else:
+        window = BATCH_WINDOW if args.socket else 0.0
+    batcher = RequestBatcher(ApiServer(index), window=window)
+    if args.socket:
+        serve_unix_socket(batcher, Path(args.socket))
+    else:
+        serve_stdio(batcher)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Extract strings from Arma Reforger game executable and compare with Workbench."""
 
+import argparse
 import re
 import os
+import sys
+
+from steam_discovery import REPO_ROOT, get_path
 
 def extract_strings(filename, min_length=8):
     """Extract ASCII and Unicode strings from binary file."""
@@ -31,8 +35,18 @@ def extract_strings(filename, min_length=8):
     return list(set(all_strings))
 
 def main():
-    game_exe = r"D:\SteamLibrary\steamapps\common\Arma Reforger\ArmaReforgerSteamDiag.exe"
-    output_dir = r"C:\Users\scarlett\Documents\workbench-reverse-engineering"
+    parser = argparse.ArgumentParser(description='Extract strings from the game executable and compare with Workbench')
+    parser.add_argument('--exe', type=str, default=None,
+                        help='Path to the game executable (auto-detected if not specified)')
+    parser.add_argument('--output', type=str, default=str(REPO_ROOT),
+                        help='Output directory, also where all_strings.txt is read from (default: repository root)')
+    args = parser.parse_args()
+
+    game_exe = args.exe or get_path('game_exe')
+    if not game_exe:
+        print("Could not auto-detect the game executable; pass --exe <path>")
+        sys.exit(1)
+    output_dir = args.output
 
     print(f"Extracting strings from GAME: {game_exe}")
     print("=" * 80)
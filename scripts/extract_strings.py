@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Extract diagnostic-related strings from Workbench executable."""
 
+import argparse
 import re
 import os
+import sys
+
+from steam_discovery import REPO_ROOT, get_path
 
 def extract_strings(filename, min_length=8):
     """Extract ASCII and Unicode strings from binary file."""
@@ -31,8 +35,18 @@ def extract_strings(filename, min_length=8):
     return list(set(all_strings))
 
 def main():
-    exe_path = r"D:\SteamLibrary\steamapps\common\Arma Reforger Tools\Workbench\ArmaReforgerWorkbenchSteamDiag.exe"
-    output_dir = r"C:\Users\scarlett\Documents\workbench-reverse-engineering"
+    parser = argparse.ArgumentParser(description='Extract diagnostic strings from the Workbench executable')
+    parser.add_argument('--exe', type=str, default=None,
+                        help='Path to the Workbench executable (auto-detected if not specified)')
+    parser.add_argument('--output', type=str, default=str(REPO_ROOT),
+                        help='Output directory (default: repository root)')
+    args = parser.parse_args()
+
+    exe_path = args.exe or get_path('workbench_exe')
+    if not exe_path:
+        print("Could not auto-detect the Workbench executable; pass --exe <path>")
+        sys.exit(1)
+    output_dir = args.output
 
     print(f"Extracting strings from: {exe_path}")
     print("=" * 80)
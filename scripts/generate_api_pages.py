@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Generate MkDocs API reference pages from the parsed API model.
+
+Renders one Markdown page per class, one per module and a module overview
+under docs/api-reference/, next to the committed landing page (index.md).
+Each page's inputs (the class record plus the cross-links it renders) are
+hashed and kept in a manifest; pages whose hash is unchanged are not
+rewritten, so their mtimes stay stable and `mkdocs serve` only rebuilds
+what actually changed.
+
+Examples:
+  python scripts/generate_api_pages.py
+  python scripts/generate_api_pages.py --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Set
+
+from api_data import load_api_classes
+
+
+MANIFEST_FILE = '.manifest.json'
+
+# The committed landing page (index.md) links here; the generator never
+# writes index.md, so generating pages leaves the tracked tree clean
+INDEX_PAGE = 'overview.md'
+LANDING_PAGE = 'index.md'
+
+# Bump when the page layout changes so every page is re-rendered once
+RENDER_VERSION = 1
+
+
+def page_hash(inputs) -> str:
+    encoded = json.dumps([RENDER_VERSION, inputs], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def module_slug(module: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_-]+', '-', module).strip('-') or 'Unknown'
+
+
+def md_escape(text: str) -> str:
+    """Escape text for use inside a Markdown table cell."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('|', '\\|')
+
+
+def link_types(type_str: str, known: Set[str], prefix: str = '') -> str:
+    """Escape a type string, linking identifiers that name documented classes."""
+    parts = re.split(r'(\w+)', type_str)
+    out = []
+    for part in parts:
+        if part in known:
+            out.append(f"[{part}]({prefix}{part}.md)")
+        else:
+            out.append(md_escape(part))
+    return ''.join(out)
+
+
+def referenced_classes(cls: dict, known: Set[str]) -> List[str]:
+    """Documented classes a class page links to from its method signatures."""
+    names = set()
+    for method in cls.get('methods', []):
+        types = [method['returnType']] + [p['type'] for p in method.get('parameters', [])]
+        for type_str in types:
+            names.update(t for t in re.findall(r'\w+', type_str) if t in known)
+    return sorted(names)
+
+
+def render_class(cls: dict, children: List[str], known: Set[str]) -> str:
+    name = cls['name']
+    module = cls.get('module') or 'Unknown'
+    lines = [f"# {name}", ""]
+
+    meta = [f"**Module:** [{module}](../modules/{module_slug(module)}.md)"]
+    if cls.get('apis'):
+        meta.append(f"**API:** {', '.join(cls['apis'])}")
+    parent = cls.get('extends')
+    if parent:
+        meta.append(f"**Extends:** {link_types(parent, known)}")
+    lines += ["  \n".join(meta), ""]
+
+    if cls.get('description'):
+        lines += [cls['description'], ""]
+
+    if children:
+        lines += ["## Subclasses", ""]
+        lines += [f"- [{child}]({child}.md)" for child in children]
+        lines.append("")
+
+    methods = cls.get('methods', [])
+    if methods:
+        lines += ["## Methods", "", "| Method | Returns | Description |", "|--------|---------|-------------|"]
+        for method in methods:
+            params = []
+            for param in method.get('parameters', []):
+                text = ' '.join(param.get('modifiers', []) + [link_types(param['type'], known)])
+                if param['name']:
+                    text += ' ' + param['name']
+                if 'default' in param:
+                    text += ' = ' + md_escape(param['default'])
+                params.append(text)
+            signature = f"**{method['name']}**({', '.join(params)})"
+            if method.get('static'):
+                signature = 'static ' + signature
+            description = md_escape(method.get('description', ''))
+            lines.append(f"| {signature} | {link_types(method['returnType'], known)} | {description} |")
+        lines.append("")
+
+    return '\n'.join(lines)
+
+
+def render_module(module: str, names: List[str]) -> str:
+    lines = [f"# {module}", "", f"{len(names)} classes.", ""]
+    lines += [f"- [{name}](../classes/{name}.md)" for name in names]
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def render_index(modules: Dict[str, List[str]]) -> str:
+    total = sum(len(names) for names in modules.values())
+    lines = [
+        "# Module Overview",
+        "",
+        f"Generated from the parsed Script API documentation: {total} classes in {len(modules)} modules.",
+        "",
+        "| Module | Classes |",
+        "|--------|---------|",
+    ]
+    for module in sorted(modules):
+        lines.append(f"| [{module}](modules/{module_slug(module)}.md) | {len(modules[module])} |")
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def build_pages(classes: List[dict]) -> Dict[str, tuple]:
+    """
+    Plan every page as path -> (hash, render callable).
+
+    Hashes cover exactly what a page shows, including links to other pages,
+    so a class page changes when its record, subclasses or linked classes do.
+    """
+    known = {cls['name'] for cls in classes}
+    children: Dict[str, List[str]] = {}
+    modules: Dict[str, List[str]] = {}
+    for cls in classes:
+        parent = cls.get('extends')
+        if parent in known:
+            children.setdefault(parent, []).append(cls['name'])
+        modules.setdefault(cls.get('module') or 'Unknown', []).append(cls['name'])
+    for names in list(children.values()) + list(modules.values()):
+        names.sort()
+
+    pages = {}
+    for cls in classes:
+        name = cls['name']
+        kids = children.get(name, [])
+        links = referenced_classes(cls, known)
+        parent_known = cls.get('extends') in known
+        digest = page_hash([cls, kids, links, parent_known])
+        pages[f"classes/{name}.md"] = (
+            digest, lambda cls=cls, kids=kids: render_class(cls, kids, known))
+
+    for module, names in modules.items():
+        pages[f"modules/{module_slug(module)}.md"] = (
+            page_hash([module, names]), lambda module=module, names=names: render_module(module, names))
+
+    counts = {module: len(names) for module, names in modules.items()}
+    pages[INDEX_PAGE] = (page_hash(counts), lambda: render_index(modules))
+    return pages
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write atomically unless the file already holds this content."""
+    if path.exists():
+        try:
+            if path.read_text(encoding='utf-8') == content:
+                return False
+        except OSError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
+def generate(classes: List[dict], output_dir: Path, force: bool = False) -> dict:
+    """
+    Bring output_dir in line with the model, touching only changed pages.
+
+    `force` re-checks every page against its rendered content instead of
+    trusting the manifest, and also removes class and module pages the
+    manifest doesn't know about. Returns counts of written, unchanged and
+    removed pages.
+    """
+    manifest_path = output_dir / MANIFEST_FILE
+    manifest: Dict[str, str] = {}
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+    pages = build_pages(classes)
+    written = unchanged = removed = 0
+    new_manifest = {}
+
+    for rel_path, (digest, render) in pages.items():
+        path = output_dir / rel_path
+        if not force and manifest.get(rel_path) == digest and path.exists():
+            unchanged += 1
+        elif write_if_changed(path, render()):
+            written += 1
+        else:
+            unchanged += 1
+        new_manifest[rel_path] = digest
+
+    # Older runs generated the landing page itself; it is committed now
+    stale = {rel_path for rel_path in manifest if rel_path not in pages and rel_path != LANDING_PAGE}
+    if force:
+        for pattern in ('classes/*.md', 'modules/*.md'):
+            stale.update(path.relative_to(output_dir).as_posix() for path in output_dir.glob(pattern)
+                         if path.relative_to(output_dir).as_posix() not in pages)
+    for rel_path in sorted(stale):
+        path = output_dir / rel_path
+        if path.exists():
+            path.unlink()
+        removed += 1
+
+    if new_manifest != manifest or not manifest_path.exists():
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(new_manifest, f, indent=0, sort_keys=True)
+
+    return {"written": written, "unchanged": unchanged, "removed": removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate MkDocs API reference pages incrementally',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Examples:')[1]
+    )
+    parser.add_argument('--api', type=str, default='data/api',
+                       help='Directory with parsed API JSON files (default: data/api)')
+    parser.add_argument('--output', type=str, default='docs/api-reference',
+                       help='Output directory for pages (default: docs/api-reference)')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-check every page and remove stray class and module pages')
+    args = parser.parse_args()
+
+    classes = load_api_classes(Path(args.api))
+    if not classes:
+        print(f"Error: no API data in {args.api}. Run scripts/parse_api_docs.py first.")
+        sys.exit(1)
+
+    counts = generate(classes, Path(args.output), force=args.force)
+    print(f"Pages written: {counts['written']}, unchanged: {counts['unchanged']}, "
+          f"removed: {counts['removed']}")
+
+
+if __name__ == '__main__':
+    main()
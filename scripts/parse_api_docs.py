@@ -7,77 +7,40 @@ Doxygen HTML files and outputs structured JSON files.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
 import sys
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
+from api_data import MERGED_FILE, OVERLOADS_FILE, TYPE_REFERENCES_FILE, describe_overload
+from steam_discovery import ARMA_ZIP, DOCS_SUBPATH, ENFUSION_ZIP, load_install
+
 
 # Relative paths from Arma Reforger Tools install
-DOCS_FOLDER = r"Workbench\docs"
-ENFUSION_ZIP = "EnfusionScriptAPIPublic.zip"
-ARMA_ZIP = "ArmaReforgerScriptAPIPublic.zip"
-ENFUSION_DOCS_SUBPATH = r"Workbench\docs\EnfusionScriptAPIPublic\EnfusionScriptAPIPublic"
-ARMA_DOCS_SUBPATH = r"Workbench\docs\ArmaReforgerScriptAPIPublic\ArmaReforgerScriptAPIPublic"
+DOCS_FOLDER = DOCS_SUBPATH
+ENFUSION_DOCS_SUBPATH = DOCS_FOLDER / "EnfusionScriptAPIPublic" / "EnfusionScriptAPIPublic"
+ARMA_DOCS_SUBPATH = DOCS_FOLDER / "ArmaReforgerScriptAPIPublic" / "ArmaReforgerScriptAPIPublic"
 
 
-def find_arma_tools_install() -> Optional[Path]:
+def find_arma_tools_install(refresh: bool = False) -> Optional[Path]:
     """
     Auto-detect Arma Reforger Tools installation path.
 
-    Checks common Steam library locations on Windows.
+    Searches Windows and Linux/Proton Steam libraries via steam_discovery,
+    reusing its cached install manifest unless `refresh` is set.
     Returns the path to 'Arma Reforger Tools' folder, or None if not found.
     """
-    # Common Steam library locations
-    common_paths = [
-        # Default Steam install
-        r"C:\Program Files (x86)\Steam\steamapps\common\Arma Reforger Tools",
-        r"C:\Program Files\Steam\steamapps\common\Arma Reforger Tools",
-        # Common secondary library drives
-        r"D:\Steam\steamapps\common\Arma Reforger Tools",
-        r"D:\SteamLibrary\steamapps\common\Arma Reforger Tools",
-        r"E:\Steam\steamapps\common\Arma Reforger Tools",
-        r"E:\SteamLibrary\steamapps\common\Arma Reforger Tools",
-        r"F:\Steam\steamapps\common\Arma Reforger Tools",
-        r"F:\SteamLibrary\steamapps\common\Arma Reforger Tools",
-        r"G:\Steam\steamapps\common\Arma Reforger Tools",
-        r"G:\SteamLibrary\steamapps\common\Arma Reforger Tools",
-    ]
-
-    # Try each common path
-    for path_str in common_paths:
-        path = Path(path_str)
-        if path.exists() and (path / "Workbench").exists():
-            return path
-
-    # Try to find via Steam's libraryfolders.vdf
-    steam_paths = [
-        Path(r"C:\Program Files (x86)\Steam"),
-        Path(r"C:\Program Files\Steam"),
-    ]
-
-    for steam_path in steam_paths:
-        vdf_path = steam_path / "steamapps" / "libraryfolders.vdf"
-        if vdf_path.exists():
-            try:
-                content = vdf_path.read_text(encoding='utf-8')
-                # Simple regex to find library paths in VDF
-                # Format: "path"		"D:\\SteamLibrary"
-                import re
-                matches = re.findall(r'"path"\s+"([^"]+)"', content)
-                for match in matches:
-                    lib_path = Path(match) / "steamapps" / "common" / "Arma Reforger Tools"
-                    if lib_path.exists() and (lib_path / "Workbench").exists():
-                        return lib_path
-            except Exception:
-                pass
-
-    return None
+    tools = load_install(refresh=refresh).get('tools')
+    return Path(tools) if tools else None
 
 
 def needs_extraction(zip_path: Path, extract_dir: Path) -> bool:
@@ -154,7 +117,7 @@ def get_api_paths(args) -> Tuple[Optional[Path], Optional[Path]]:
 
     # If not all paths specified, try auto-detection
     if not enfusion_path or not arma_path:
-        tools_path = find_arma_tools_install()
+        tools_path = find_arma_tools_install(refresh=args.rediscover)
 
         if tools_path:
             print(f"Found Arma Reforger Tools at: {tools_path}")
@@ -233,12 +196,10 @@ def parse_method_signature(method_row: Tag, desc_row: Optional[Tag]) -> dict:
         # Get full text for parameter parsing
         full_text = right_td.get_text()
 
-        # Extract parameters from parentheses
-        param_match = re.search(r'\(([^)]*)\)', full_text)
-        if param_match:
-            params_str = param_match.group(1).strip()
-            if params_str:
-                method['parameters'] = parse_parameters(params_str)
+        # Extract parameters from the balanced parentheses after the name
+        params_str = extract_parenthesized(full_text, full_text.find('('))
+        if params_str and params_str.strip():
+            method['parameters'] = parse_parameters(params_str.strip())
 
     # Get description from description row
     if desc_row:
@@ -249,32 +210,88 @@ def parse_method_signature(method_row: Tag, desc_row: Optional[Tag]) -> dict:
     return method
 
 
-def parse_parameters(params_str: str) -> list:
-    """Parse parameter string into list of parameter objects."""
-    params = []
-    if not params_str or params_str.isspace():
-        return params
+PARAMETER_MODIFIERS = ('out', 'inout', 'notnull', 'const')
+
 
-    # Split by comma, but be careful of nested types like array<T>
+def extract_parenthesized(text: str, start: int) -> Optional[str]:
+    """
+    Return the text inside the parentheses opening at text[start].
+
+    Nested parentheses and string literals are skipped over, so defaults
+    such as Vector(0, 0, 0) or ")" don't end the list early.
+    """
+    if start < 0 or start >= len(text) or text[start] != '(':
+        return None
+    depth = 0
+    quote = None
+    i = start
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i]
+        i += 1
+    # Unbalanced: take everything after the opening parenthesis
+    return text[start + 1:]
+
+
+def split_top_level(text: str, separator: str = ',') -> list:
+    """Split on separator outside brackets, generics and string literals."""
     depth = 0
+    quote = None
     current = ""
     parts = []
 
-    for char in params_str:
-        if char in '<[(':
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            current += char
+            if char == '\\' and i + 1 < len(text):
+                i += 1
+                current += text[i]
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+            current += char
+        elif char in '<[(':
             depth += 1
             current += char
         elif char in '>])':
             depth -= 1
             current += char
-        elif char == ',' and depth == 0:
+        elif char == separator and depth == 0:
             parts.append(current.strip())
             current = ""
         else:
             current += char
+        i += 1
 
     if current.strip():
         parts.append(current.strip())
+    return parts
+
+
+def parse_parameters(params_str: str) -> list:
+    """Parse parameter string into list of parameter objects."""
+    params = []
+    if not params_str or params_str.isspace():
+        return params
+
+    # Split by comma, but be careful of nested types like array<T> and
+    # commas inside default values such as "," or Vector(0, 0, 0)
+    parts = split_top_level(params_str)
 
     for part in parts:
         part = part.strip()
@@ -283,19 +300,20 @@ def parse_parameters(params_str: str) -> list:
 
         param = {"name": "", "type": ""}
 
-        # Handle default values
+        # Handle default values - keep them so optional parameters are known
+        default = None
         if '=' in part:
-            part = part.split('=')[0].strip()
+            part, default = part.split('=', 1)
+            part = part.strip()
+            default = default.strip()
 
-        # Handle modifiers like 'out', 'inout', 'notnull', 'const'
+        # Handle modifiers like 'out', 'inout', 'notnull', 'const' in any order
         modifiers = []
-        for mod in ['out', 'inout', 'notnull', 'const']:
-            if part.startswith(mod + ' '):
-                modifiers.append(mod)
-                part = part[len(mod):].strip()
+        tokens = part.split()
+        while len(tokens) > 1 and tokens[0] in PARAMETER_MODIFIERS:
+            modifiers.append(tokens.pop(0))
 
         # Split type and name - name is last token
-        tokens = part.split()
         if len(tokens) >= 2:
             param['name'] = tokens[-1]
             param['type'] = ' '.join(tokens[:-1])
@@ -306,21 +324,34 @@ def parse_parameters(params_str: str) -> list:
 
         if modifiers:
             param['modifiers'] = modifiers
+        if default is not None:
+            param['default'] = default
 
         params.append(param)
 
     return params
 
 
-def parse_class_file(filepath: Path) -> Optional[dict]:
-    """Parse a single class HTML file."""
+def read_class_file(filepath: Path) -> Optional[str]:
+    """Read a class HTML file, returning None if it can't be read."""
     try:
         with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            return f.read()
     except Exception as e:
         print(f"Error reading {filepath}: {e}", file=sys.stderr)
         return None
 
+
+def parse_class_file(filepath: Path) -> Optional[dict]:
+    """Parse a single class HTML file."""
+    content = read_class_file(filepath)
+    if content is None:
+        return None
+    return parse_class_content(content)
+
+
+def parse_class_content(content: str) -> Optional[dict]:
+    """Parse the HTML of a single class page."""
     soup = BeautifulSoup(content, 'lxml')
 
     # Get class name from title
@@ -450,8 +481,49 @@ def parse_class_file(filepath: Path) -> Optional[dict]:
     return class_data
 
 
-def parse_api_docs(docs_path: Path) -> list:
-    """Parse all class documentation from a Doxygen docs folder."""
+def prefetch_files(paths: list, io_threads: int, depth: int) -> Iterator[Tuple[Optional[str], float]]:
+    """
+    Read files on a thread pool ahead of the consumer.
+
+    At most `depth` reads are in flight or buffered at once, so memory stays
+    bounded. Yields (content, wait) in input order, where wait is how long
+    the consumer blocked on that file's I/O.
+    """
+    with ThreadPoolExecutor(max_workers=io_threads) as pool:
+        pending = deque()
+        remaining = iter(paths)
+
+        for filepath in remaining:
+            pending.append(pool.submit(read_class_file, filepath))
+            if len(pending) >= depth:
+                break
+
+        while pending:
+            start = time.perf_counter()
+            content = pending.popleft().result()
+            wait = time.perf_counter() - start
+            # Refill before handing the content to the parse stage
+            filepath = next(remaining, None)
+            if filepath is not None:
+                pending.append(pool.submit(read_class_file, filepath))
+            yield content, wait
+
+
+def timed_parse(content: Optional[str]) -> Tuple[Optional[dict], float]:
+    """Parse class HTML and report the CPU time spent (runs in worker processes)."""
+    start = time.perf_counter()
+    class_data = parse_class_content(content) if content is not None else None
+    return class_data, time.perf_counter() - start
+
+
+def parse_api_docs(docs_path: Path, jobs: int = 1, io_threads: int = 4, prefetch: int = 32) -> list:
+    """
+    Parse all class documentation from a Doxygen docs folder.
+
+    File reads run on `io_threads` threads ahead of parsing, up to `prefetch`
+    files deep. Parsing runs in-process when jobs is 1, otherwise on a pool
+    of `jobs` worker processes.
+    """
     classes = []
 
     # Find all interface*.html files (excluding -members.html)
@@ -460,17 +532,100 @@ def parse_api_docs(docs_path: Path) -> list:
 
     print(f"Found {len(class_files)} class files in {docs_path}")
 
-    for i, filepath in enumerate(class_files):
+    io_wait = 0.0
+    parse_time = 0.0
+    start = time.perf_counter()
+
+    def collect(i: int, result: Tuple[Optional[dict], float]):
+        nonlocal parse_time
+        class_data, elapsed = result
+        parse_time += elapsed
         if (i + 1) % 100 == 0:
             print(f"Processing {i + 1}/{len(class_files)}...")
-
-        class_data = parse_class_file(filepath)
         if class_data:
             classes.append(class_data)
 
+    contents = prefetch_files(class_files, io_threads, prefetch)
+
+    if jobs <= 1:
+        for i, (content, wait) in enumerate(contents):
+            io_wait += wait
+            collect(i, timed_parse(content))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # Bound in-flight parses too, so prefetched text doesn't pile up
+            in_flight = deque()
+            done = 0
+            for content, wait in contents:
+                io_wait += wait
+                in_flight.append(pool.submit(timed_parse, content))
+                if len(in_flight) >= jobs * 2:
+                    collect(done, in_flight.popleft().result())
+                    done += 1
+            while in_flight:
+                collect(done, in_flight.popleft().result())
+                done += 1
+
+    elapsed = time.perf_counter() - start
+    print(f"Parsed in {elapsed:.2f}s: I/O wait {io_wait:.2f}s, "
+          f"parse {parse_time:.2f}s summed over {jobs} process{'es' if jobs > 1 else ''} "
+          f"({io_threads} I/O threads)")
+
     return classes
 
 
+def content_hash(record: dict) -> str:
+    """Stable hash of a JSON record, independent of key order."""
+    encoded = json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def merge_api_sets(api_sets: list) -> Tuple[list, list]:
+    """
+    Merge several parsed API sets into one resolved class list.
+
+    Args:
+        api_sets: List of (api_name, classes) in precedence order, e.g.
+            [('enfusion', ...), ('arma-reforger', ...)]
+
+    Returns:
+        (classes, conflicts). Each class appears once with 'apis' listing
+        the sets that document it, 'contentHash' of its source record, and
+        'parentApi' naming the set its parent resolves to. A name documented
+        with differing content is kept from the earliest set and reported
+        in conflicts.
+    """
+    merged = {}
+    conflicts = {}
+
+    for api_name, classes in api_sets:
+        for cls in classes:
+            name = cls['name']
+            digest = content_hash(cls)
+            existing = merged.get(name)
+            if existing is None:
+                record = dict(cls)
+                record['apis'] = [api_name]
+                record['contentHash'] = digest
+                merged[name] = record
+                continue
+
+            if api_name not in existing['apis']:
+                existing['apis'].append(api_name)
+            if digest != existing['contentHash']:
+                conflict = conflicts.setdefault(name, {
+                    "name": name,
+                    "versions": [{"api": existing['apis'][0], "contentHash": existing['contentHash']}],
+                })
+                conflict['versions'].append({"api": api_name, "contentHash": digest})
+
+    for record in merged.values():
+        parent = merged.get(record.get('extends'))
+        record['parentApi'] = parent['apis'][0] if parent else None
+
+    return list(merged.values()), list(conflicts.values())
+
+
 def build_inheritance_tree(classes: list) -> dict:
     """Build inheritance tree from parsed classes."""
     tree = {
@@ -492,12 +647,102 @@ def build_inheritance_tree(classes: list) -> dict:
     return tree
 
 
+def build_overload_index(classes: list) -> dict:
+    """
+    Build a call-site resolution index.
+
+    'declared' holds each class's own overloads (class -> method name ->
+    overloads) exactly once; 'ancestry' holds the flattened chain
+    (class, parent, grandparent, ...) per class. api_data.resolve_overloads
+    walks that chain to list the overloads callable on a class.
+    """
+    by_name = {}
+    for cls in classes:
+        by_name.setdefault(cls['name'], cls)
+
+    declared = {}
+    ancestry = {}
+    for name, cls in by_name.items():
+        methods = {}
+        for method in cls.get('methods', []):
+            methods.setdefault(method['name'], []).append(describe_overload(method))
+        if methods:
+            declared[name] = methods
+
+        chain = []
+        current = name
+        while current in by_name and current not in chain:  # Stops on cycles in malformed docs
+            chain.append(current)
+            current = by_name[current].get('extends')
+        ancestry[name] = chain
+
+    return {"ancestry": ancestry, "declared": declared}
+
+
+# Words in a type string that are not type names themselves
+TYPE_QUALIFIERS = {'ref', 'autoptr', 'const', 'notnull', 'out', 'inout', 'owned',
+                   'static', 'proto', 'external', 'native', 'volatile', 'private', 'protected'}
+# Containers are unwrapped and builtins carry no "how do I get one" question
+GENERIC_CONTAINERS = {'array', 'set', 'map'}
+BUILTIN_TYPES = {'void', 'int', 'float', 'bool', 'string', 'vector', 'typename', 'auto', 'func', 'Class'}
+
+
+def normalize_type_names(type_str: str) -> list:
+    """
+    Extract the class names referenced by a type string.
+
+    Qualifiers are dropped and generics unwrapped, so 'array<ref IEntity>'
+    yields ['IEntity'] and 'map<string, ref SCR_Foo>' yields ['SCR_Foo'].
+    """
+    names = []
+    for token in re.findall(r'\w+', type_str):
+        if token in TYPE_QUALIFIERS or token in GENERIC_CONTAINERS or token in BUILTIN_TYPES:
+            continue
+        if token[0].isdigit() or token in names:
+            continue
+        names.append(token)
+    return names
+
+
+def build_type_references(classes: list) -> dict:
+    """
+    Build a reverse index from type name to the methods that use it.
+
+    Each entry records the class, method and role: 'return' for return
+    types, 'out' for out/inout parameters (both hand a value back to the
+    caller) and 'parameter' for plain inputs.
+    """
+    refs = {}
+
+    for cls in classes:
+        for method in cls.get('methods', []):
+            for name in normalize_type_names(method['returnType']):
+                refs.setdefault(name, []).append({
+                    "class": cls['name'],
+                    "method": method['name'],
+                    "role": "return",
+                })
+            for param in method.get('parameters', []):
+                modifiers = param.get('modifiers', [])
+                role = 'out' if ('out' in modifiers or 'inout' in modifiers) else 'parameter'
+                for name in normalize_type_names(param['type']):
+                    refs.setdefault(name, []).append({
+                        "class": cls['name'],
+                        "method": method['name'],
+                        "role": role,
+                        "parameter": param['name'],
+                    })
+
+    return refs
+
+
 def generate_summary(classes: list) -> dict:
     """Generate summary statistics from parsed classes."""
     summary = {
         "total_classes": len(classes),
         "class_names": sorted([c['name'] for c in classes]),
         "modules": {},
+        "apis": {},
         "method_counts": {}
     }
 
@@ -508,6 +753,10 @@ def generate_summary(classes: list) -> dict:
             summary['modules'][module] = 0
         summary['modules'][module] += 1
 
+        # Count by source API (set by merge_api_sets)
+        for api in cls.get('apis', []):
+            summary['apis'][api] = summary['apis'].get(api, 0) + 1
+
         # Method count per class
         summary['method_counts'][cls['name']] = len(cls.get('methods', []))
 
@@ -529,6 +778,9 @@ Examples:
   # Just parse (assumes docs already extracted)
   python scripts/parse_api_docs.py
 
+  # Parse on 4 processes (useful on slow or network Steam libraries)
+  python scripts/parse_api_docs.py --jobs 4
+
   # Specify paths manually (skips auto-detection)
   python scripts/parse_api_docs.py \\
     --enfusion "C:\\path\\to\\EnfusionScriptAPIPublic" \\
@@ -545,12 +797,24 @@ Examples:
                        help='Extract zip files if newer than existing docs')
     parser.add_argument('--force-extract', action='store_true',
                        help='Force re-extraction of zip files')
+    parser.add_argument('--rediscover', action='store_true',
+                       help='Ignore the cached install manifest and search Steam libraries again')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Worker processes for HTML parsing (default: 1, in-process)')
+    parser.add_argument('--io-threads', type=int, default=4,
+                       help='Threads reading files ahead of the parser (default: 4)')
+    parser.add_argument('--prefetch', type=int, default=32,
+                       help='Maximum files read ahead of the parser (default: 32)')
     args = parser.parse_args()
 
+    for option in ('jobs', 'io_threads', 'prefetch'):
+        if getattr(args, option) < 1:
+            parser.error(f"--{option.replace('_', '-')} must be at least 1")
+
     # Handle extraction if requested
     tools_path = None
     if args.extract or args.force_extract:
-        tools_path = find_arma_tools_install()
+        tools_path = find_arma_tools_install(refresh=args.rediscover)
         if tools_path:
             print(f"\n=== Checking API Documentation ===")
             extract_api_docs(tools_path, force=args.force_extract)
@@ -568,12 +832,12 @@ Examples:
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    all_classes = []
+    api_sets = []
 
     # Parse Enfusion API
     if enfusion_path and enfusion_path.exists():
         print(f"\n=== Parsing Enfusion Script API ===")
-        enfusion_classes = parse_api_docs(enfusion_path)
+        enfusion_classes = parse_api_docs(enfusion_path, args.jobs, args.io_threads, args.prefetch)
         print(f"Parsed {len(enfusion_classes)} classes from Enfusion API")
 
         # Save Enfusion JSON
@@ -581,14 +845,14 @@ Examples:
             json.dump(enfusion_classes, f, indent=2)
         print(f"Saved to {output_dir / 'enfusion.json'}")
 
-        all_classes.extend(enfusion_classes)
+        api_sets.append(('enfusion', enfusion_classes))
     elif enfusion_path:
         print(f"Warning: Enfusion docs not found at {enfusion_path}")
 
     # Parse Arma Reforger API
     if arma_path and arma_path.exists():
         print(f"\n=== Parsing Arma Reforger Script API ===")
-        arma_classes = parse_api_docs(arma_path)
+        arma_classes = parse_api_docs(arma_path, args.jobs, args.io_threads, args.prefetch)
         print(f"Parsed {len(arma_classes)} classes from Arma Reforger API")
 
         # Save Arma Reforger JSON
@@ -596,10 +860,23 @@ Examples:
             json.dump(arma_classes, f, indent=2)
         print(f"Saved to {output_dir / 'arma-reforger.json'}")
 
-        all_classes.extend(arma_classes)
+        api_sets.append(('arma-reforger', arma_classes))
     elif arma_path:
         print(f"Warning: Arma Reforger docs not found at {arma_path}")
 
+    # Merge both sets into one resolved model
+    print(f"\n=== Merging API Sets ===")
+    all_classes, conflicts = merge_api_sets(api_sets)
+    parsed_total = sum(len(classes) for _, classes in api_sets)
+    with open(output_dir / MERGED_FILE, 'w', encoding='utf-8') as f:
+        json.dump(all_classes, f, indent=2)
+    print(f"Merged {parsed_total} parsed classes into {len(all_classes)} unique classes")
+    print(f"Saved to {output_dir / MERGED_FILE}")
+    with open(output_dir / 'merge-conflicts.json', 'w', encoding='utf-8') as f:
+        json.dump(conflicts, f, indent=2)
+    if conflicts:
+        print(f"Warning: {len(conflicts)} classes differ between API sets, see {output_dir / 'merge-conflicts.json'}")
+
     # Generate summary
     print(f"\n=== Generating Summary ===")
     summary = generate_summary(all_classes)
@@ -614,9 +891,23 @@ Examples:
         json.dump(tree, f, indent=2)
     print(f"Saved inheritance tree to {output_dir / 'inheritance-tree.json'}")
 
+    # Generate overload resolution index
+    print(f"\n=== Generating Overload Index ===")
+    overloads = build_overload_index(all_classes)
+    with open(output_dir / OVERLOADS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(overloads, f, separators=(',', ':'))
+    print(f"Saved overload index to {output_dir / OVERLOADS_FILE}")
+
+    # Generate reverse type-reference index
+    print(f"\n=== Generating Type References ===")
+    type_refs = build_type_references(all_classes)
+    with open(output_dir / TYPE_REFERENCES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(type_refs, f, separators=(',', ':'))
+    print(f"Saved type references to {output_dir / TYPE_REFERENCES_FILE}")
+
     # Print summary
     print(f"\n=== Summary ===")
-    print(f"Total classes parsed: {len(all_classes)}")
+    print(f"Total classes parsed: {parsed_total} ({len(all_classes)} unique)")
     print(f"Modules found: {len(summary['modules'])}")
     print(f"Root classes (no parent): {len(tree['roots'])}")
 
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Locate Arma Reforger and Arma Reforger Tools installs across Steam libraries.
+
+Understands Windows Steam installs and Linux Steam (native, Flatpak and Snap)
+running the games through Proton. Results are cached in a manifest that
+records the mtime of everything probed; while none of those change, later
+invocations reuse the manifest without touching the Steam libraries.
+
+Run directly to print what was found:
+
+    python scripts/steam_discovery.py [--refresh]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+TOOLS_APPID = "1874910"
+GAME_APPID = "1874880"
+TOOLS_FOLDER = "Arma Reforger Tools"
+GAME_FOLDER = "Arma Reforger"
+
+DOCS_SUBPATH = Path("Workbench") / "docs"
+ENFUSION_ZIP = "EnfusionScriptAPIPublic.zip"
+ARMA_ZIP = "ArmaReforgerScriptAPIPublic.zip"
+
+# Preferred first: the Diag builds carry the full diagnostic string set
+WORKBENCH_EXES = ["ArmaReforgerWorkbenchSteamDiag.exe", "ArmaReforgerWorkbenchSteam.exe"]
+GAME_EXES = ["ArmaReforgerSteamDiag.exe", "ArmaReforgerSteam.exe"]
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MANIFEST = REPO_ROOT / "data" / "install-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def parse_vdf(text: str) -> dict:
+    """
+    Parse Valve KeyValues text (libraryfolders.vdf, appmanifest_*.acf).
+
+    Keys and values are quoted strings; nested sections use braces.
+    """
+    tokens = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == '"':
+            i += 1
+            buf = []
+            while i < n and text[i] != '"':
+                if text[i] == '\\' and i + 1 < n:
+                    i += 1
+                buf.append(text[i])
+                i += 1
+            tokens.append(''.join(buf))
+            i += 1
+        elif c in '{}':
+            tokens.append(c)
+            i += 1
+        elif c == '/' and text.startswith('//', i):
+            end = text.find('\n', i)
+            i = n if end < 0 else end
+        else:
+            i += 1
+
+    root: dict = {}
+    stack = [root]
+    key = None
+    for token in tokens:
+        if token == '{':
+            section: dict = {}
+            if key is not None:
+                stack[-1][key] = section
+            stack.append(section)
+            key = None
+        elif token == '}':
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = token
+        else:
+            stack[-1][key] = token
+            key = None
+    return root
+
+
+def default_steam_roots(home: Optional[Path] = None) -> List[Path]:
+    """Candidate Steam install roots for the current platform."""
+    if os.name == 'nt':
+        roots = []
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam") as key:
+                roots.append(Path(winreg.QueryValueEx(key, "SteamPath")[0]))
+        except (ImportError, OSError):
+            pass
+        roots += [
+            Path(r"C:\Program Files (x86)\Steam"),
+            Path(r"C:\Program Files\Steam"),
+        ]
+        return roots
+
+    home = home or Path.home()
+    return [
+        home / ".steam" / "steam",
+        home / ".steam" / "root",
+        home / ".local" / "share" / "Steam",
+        home / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam",
+        home / "snap" / "steam" / "common" / ".local" / "share" / "Steam",
+    ]
+
+
+def default_extra_libraries() -> List[Path]:
+    """Secondary library locations commonly used without being registered."""
+    if os.name != 'nt':
+        return []
+    return [Path(f"{drive}:\\{folder}") for drive in "DEFG" for folder in ("Steam", "SteamLibrary")]
+
+
+class Probe:
+    """Filesystem access that remembers the mtime of everything it looked at."""
+
+    def __init__(self):
+        self.seen: Dict[str, Optional[float]] = {}
+
+    def mtime(self, path: Path) -> Optional[float]:
+        try:
+            value = path.stat().st_mtime
+        except OSError:
+            value = None
+        self.seen[str(path)] = value
+        return value
+
+    def exists(self, path: Path) -> bool:
+        return self.mtime(path) is not None
+
+    def read_vdf(self, path: Path) -> Optional[dict]:
+        if not self.exists(path):
+            return None
+        try:
+            return parse_vdf(path.read_text(encoding='utf-8', errors='ignore'))
+        except OSError:
+            return None
+
+
+def find_libraries(probe: Probe, steam_roots: List[Path], extra: List[Path]) -> List[Path]:
+    """Resolve every Steam library folder, following libraryfolders.vdf."""
+    libraries: List[Path] = []
+    seen = set()
+
+    def add(path: Path):
+        try:
+            key = os.path.normcase(str(path.resolve()))
+        except OSError:
+            key = os.path.normcase(str(path))
+        if key not in seen and probe.exists(path / "steamapps"):
+            seen.add(key)
+            libraries.append(path)
+
+    for root in steam_roots:
+        add(root)
+        for vdf_path in (root / "steamapps" / "libraryfolders.vdf",
+                         root / "config" / "libraryfolders.vdf"):
+            data = probe.read_vdf(vdf_path)
+            if not data:
+                continue
+            folders = data.get('libraryfolders') or data.get('LibraryFolders') or {}
+            for entry in folders.values():
+                # Current format nests {"path": ...}; old format maps index -> path
+                path = entry.get('path') if isinstance(entry, dict) else entry
+                if isinstance(path, str) and path:
+                    add(Path(path))
+
+    for path in extra:
+        add(path)
+    return libraries
+
+
+def find_app(probe: Probe, libraries: List[Path], appid: str, folder: str,
+             markers: List[str]) -> Optional[Path]:
+    """
+    Find an app's install dir via its appmanifest, falling back to the
+    default folder name. The dir must contain one of `markers`.
+    """
+    for library in libraries:
+        steamapps = library / "steamapps"
+        acf = probe.read_vdf(steamapps / f"appmanifest_{appid}.acf")
+        installdir = (acf or {}).get('AppState', {}).get('installdir') or folder
+        path = steamapps / "common" / installdir
+        if first_existing(probe, path, markers):
+            return path
+    return None
+
+
+def first_existing(probe: Probe, directory: Optional[Path], names: List[str]) -> Optional[Path]:
+    if directory is None:
+        return None
+    for name in names:
+        if probe.exists(directory / name):
+            return directory / name
+    return None
+
+
+def discover(steam_roots: Optional[List[Path]] = None,
+             extra_libraries: Optional[List[Path]] = None) -> dict:
+    """
+    Probe Steam libraries and return an install manifest.
+
+    Paths in the manifest are strings (or None when not found). The
+    'probed' map records the mtime of every path looked at, for validation.
+    """
+    probe = Probe()
+    roots = default_steam_roots() if steam_roots is None else steam_roots
+    extra = default_extra_libraries() if extra_libraries is None else extra_libraries
+    libraries = find_libraries(probe, roots, extra)
+
+    tools = find_app(probe, libraries, TOOLS_APPID, TOOLS_FOLDER, ["Workbench"])
+    game = find_app(probe, libraries, GAME_APPID, GAME_FOLDER, GAME_EXES)
+    docs = tools / DOCS_SUBPATH if tools else None
+
+    # Proton prefixes live next to the library the app is installed in
+    compatdata = {}
+    for appid, install in ((TOOLS_APPID, tools), (GAME_APPID, game)):
+        if install is None:
+            continue
+        prefix = install.parent.parent / "compatdata" / appid / "pfx"
+        if probe.exists(prefix):
+            compatdata[appid] = str(prefix)
+
+    def opt(path: Optional[Path]) -> Optional[str]:
+        return str(path) if path else None
+
+    return {
+        "version": MANIFEST_VERSION,
+        "steam_roots": [str(p) for p in roots],
+        "extra_libraries": [str(p) for p in extra],
+        "libraries": [str(p) for p in libraries],
+        "tools": opt(tools),
+        "game": opt(game),
+        "docs": opt(docs if docs and probe.exists(docs) else None),
+        "enfusion_zip": opt(first_existing(probe, docs, [ENFUSION_ZIP])),
+        "arma_zip": opt(first_existing(probe, docs, [ARMA_ZIP])),
+        "workbench_exe": opt(first_existing(probe, tools / "Workbench" if tools else None, WORKBENCH_EXES)),
+        "game_exe": opt(first_existing(probe, game, GAME_EXES)),
+        "compatdata": compatdata,
+        "probed": probe.seen,
+    }
+
+
+def manifest_is_valid(manifest: dict, steam_roots: List[Path], extra_libraries: List[Path]) -> bool:
+    """True if the manifest was built for these roots and nothing it probed has changed."""
+    if manifest.get('version') != MANIFEST_VERSION:
+        return False
+    if manifest.get('steam_roots') != [str(p) for p in steam_roots]:
+        return False
+    if manifest.get('extra_libraries') != [str(p) for p in extra_libraries]:
+        return False
+    for path, recorded in manifest.get('probed', {}).items():
+        try:
+            current = os.stat(path).st_mtime
+        except OSError:
+            current = None
+        if current != recorded:
+            return False
+    return True
+
+
+def load_install(manifest_path: Optional[Path] = DEFAULT_MANIFEST, refresh: bool = False,
+                 steam_roots: Optional[List[Path]] = None,
+                 extra_libraries: Optional[List[Path]] = None) -> dict:
+    """
+    Return the install manifest, reusing the cached one while it is valid.
+
+    Pass manifest_path=None to skip caching entirely.
+    """
+    roots = default_steam_roots() if steam_roots is None else steam_roots
+    extra = default_extra_libraries() if extra_libraries is None else extra_libraries
+
+    if manifest_path is not None and not refresh and manifest_path.exists():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest_is_valid(manifest, roots, extra):
+                return manifest
+        except (OSError, ValueError):
+            pass
+
+    manifest = discover(roots, extra)
+    if manifest_path is not None:
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+        except OSError as e:
+            print(f"Warning: could not write {manifest_path}: {e}", file=sys.stderr)
+    return manifest
+
+
+def get_path(key: str, **kwargs) -> Optional[Path]:
+    """Convenience accessor: a single manifest entry as a Path, or None."""
+    value = load_install(**kwargs).get(key)
+    return Path(value) if value else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Locate Arma Reforger installs in Steam libraries')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore the cached manifest and probe again')
+    parser.add_argument('--steam-root', action='append', default=None,
+                       help='Steam root to search (repeatable; replaces the defaults)')
+    parser.add_argument('--manifest', type=str, default=str(DEFAULT_MANIFEST),
+                       help=f'Manifest cache path (default: {DEFAULT_MANIFEST})')
+    args = parser.parse_args()
+
+    roots = [Path(p) for p in args.steam_root] if args.steam_root else None
+    manifest = load_install(Path(args.manifest), refresh=args.refresh, steam_roots=roots)
+
+    for key in ("tools", "game", "docs", "enfusion_zip", "arma_zip", "workbench_exe", "game_exe"):
+        print(f"{key:14} {manifest[key] or '(not found)'}")
+    for appid, prefix in manifest['compatdata'].items():
+        print(f"{'proton ' + appid:14} {prefix}")
+    print(f"{'libraries':14} {', '.join(manifest['libraries']) or '(none)'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Tests for api_server.py request handling, run with: python -m pytest scripts"""
+
+import unittest
+
+from api_model import ApiClass
+from api_server import ApiIndex, ApiServer
+from parse_api_docs import build_overload_index
+
+
+def make_class(name, extends=None, methods=()):
+    return ApiClass.from_dict({
+        "name": name,
+        "extends": extends,
+        "module": "Test",
+        "methods": list(methods),
+        "properties": [],
+        "description": "",
+    })
+
+
+def make_server():
+    index = ApiIndex([
+        make_class('Managed'),
+        make_class('ScriptComponent', 'Managed'),
+    ])
+    return ApiServer(index)
+
+
+class ValidateFileTest(unittest.TestCase):
+
+    def diagnostics(self, source):
+        return make_server().validate_file({"source": source})['diagnostics']
+
+    def test_colon_base_class(self):
+        self.assertEqual(self.diagnostics("class A : ScriptComponent\n{\n}\n"), [])
+        found = self.diagnostics("class A : NopeComponent\n{\n}\n")
+        self.assertEqual([(d['line'], d['message']) for d in found],
+                         [(1, "Unknown base class 'NopeComponent'")])
+
+    def test_extends_base_class(self):
+        self.assertEqual(self.diagnostics("class A extends ScriptComponent\n{\n}\n"), [])
+        found = self.diagnostics("class A extends Managed {}\nclass B extends NopeComponent\n{\n}\n")
+        self.assertEqual([(d['line'], d['message']) for d in found],
+                         [(2, "Unknown base class 'NopeComponent'")])
+
+    def test_base_declared_in_same_file(self):
+        self.assertEqual(self.diagnostics("class A extends Managed {}\nclass B extends A {}\nclass C : B {}\n"), [])
+
+
+class CheckSignatureTest(unittest.TestCase):
+
+    def test_rejects_boolean_argc(self):
+        reply = make_server().handle_batch([{
+            "jsonrpc": "2.0", "id": 1, "method": "check_signature",
+            "params": {"class": "Managed", "method": "Foo", "argc": True},
+        }])[0]
+        self.assertEqual(reply['error']['message'], "'argc' must be an integer")
+
+
+class ResolveOverloadsTest(unittest.TestCase):
+
+    def test_fallback_matches_overload_index(self):
+        def method(*params):
+            return {"name": "Spawn", "returnType": "void", "parameters": list(params),
+                    "static": False, "access": "public", "description": ""}
+        required = {"name": "a", "type": "int", "modifiers": []}
+        optional = {"name": "b", "type": "float", "modifiers": [], "default": "1.0"}
+        classes = [
+            make_class('Base', methods=[method(required, optional), method()]),
+            make_class('Derived', 'Base', methods=[method(required, optional)]),
+        ]
+        with_index = ApiIndex(classes, build_overload_index([c.to_dict() for c in classes]))
+        without_index = ApiIndex(classes)
+
+        resolved = with_index.resolve_overloads('Derived', 'Spawn')
+        self.assertEqual([(o['declaredIn'], o['minArity'], o['maxArity']) for o in resolved],
+                         [('Derived', 1, 2), ('Base', 0, 0)])
+        self.assertEqual(without_index.resolve_overloads('Derived', 'Spawn'), resolved)
+
+
+class HandleBatchTest(unittest.TestCase):
+
+    def test_only_repeated_requests_count_as_deduplicated(self):
+        server = make_server()
+        lookup = {"jsonrpc": "2.0", "id": 1, "method": "lookup_class", "params": {"name": "Managed"}}
+        server.handle_batch(["nope", {"x": 1}, {"y": 2}])
+        self.assertEqual(server.metrics.snapshot()['deduplicated'], 0)
+        server.handle_batch([lookup, dict(lookup, id=2), "nope"])
+        self.assertEqual(server.metrics.snapshot()['deduplicated'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
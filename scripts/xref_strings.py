@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Link diagnostic strings in a PE64 executable to the code that uses them.
+
+Locates each string (ASCII or UTF-16LE) in the image to get its RVA, then
+scans the whole .text section with NumPy for RIP-relative displacements
+(lea/mov reg, [rip+disp32]) that resolve to a string, and the data sections
+for absolute pointers to strings (message tables). Code references are
+grouped by the function containing them, using the .pdata unwind table, so
+strings emitted by the same compiler routine end up in one cluster.
+
+Usage:
+  python scripts/extract_strings.py
+  python scripts/xref_strings.py [--exe PATH] [--strings diagnostic_strings.txt]
+"""
+
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from steam_discovery import REPO_ROOT, get_path
+
+
+IMAGE_FILE_MACHINE_AMD64 = 0x8664
+PE32_PLUS_MAGIC = 0x20B
+EXCEPTION_DIRECTORY = 3
+
+# .text is scanned in windows of this many bytes to bound temporary arrays
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Pointer slots further apart than this start a new table
+TABLE_GAP = 32
+
+# Control characters extract_strings.py splits at, but which can sit inside
+# a string the code references
+TEXT_CONTROL_CHARS = {0x09, 0x0A, 0x0D}
+
+# ModRM byte with mod=00, rm=101: [rip + disp32]
+MODRM_RIP_MASK = 0xC7
+MODRM_RIP = 0x05
+OPCODES = {0x8D: 'lea', 0x8B: 'mov'}
+
+
+class Section(NamedTuple):
+    name: str
+    rva: int
+    virtual_size: int
+    raw_offset: int
+    raw_size: int
+
+
+class PEImage:
+    """Minimal PE32+ reader: sections, image base and the exception directory."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        if data[:2] != b'MZ':
+            raise ValueError("Not a PE file (missing MZ header)")
+        pe_offset = struct.unpack_from('<I', data, 0x3C)[0]
+        if data[pe_offset:pe_offset + 4] != b'PE\0\0':
+            raise ValueError("Not a PE file (missing PE signature)")
+
+        coff = pe_offset + 4
+        machine, num_sections = struct.unpack_from('<HH', data, coff)
+        opt_size = struct.unpack_from('<H', data, coff + 16)[0]
+        if machine != IMAGE_FILE_MACHINE_AMD64:
+            raise ValueError(f"Unsupported machine type 0x{machine:04x}; only x86-64 is handled")
+
+        opt = coff + 20
+        if struct.unpack_from('<H', data, opt)[0] != PE32_PLUS_MAGIC:
+            raise ValueError("Not a PE32+ image")
+        self.image_base = struct.unpack_from('<Q', data, opt + 24)[0]
+        num_dirs = struct.unpack_from('<I', data, opt + 108)[0]
+        self.directories = [
+            struct.unpack_from('<II', data, opt + 112 + 8 * i) for i in range(num_dirs)
+        ]
+
+        self.sections: List[Section] = []
+        table = opt + opt_size
+        for i in range(num_sections):
+            entry = table + 40 * i
+            name = data[entry:entry + 8].rstrip(b'\0').decode('ascii', errors='replace')
+            vsize, rva, raw_size, raw_offset = struct.unpack_from('<IIII', data, entry + 8)
+            self.sections.append(Section(name, rva, vsize, raw_offset, raw_size))
+
+    def section(self, name: str) -> Optional[Section]:
+        for section in self.sections:
+            if section.name == name:
+                return section
+        return None
+
+    def section_bytes(self, section: Section) -> bytes:
+        size = min(section.raw_size, section.virtual_size or section.raw_size)
+        return self.data[section.raw_offset:section.raw_offset + size]
+
+    def rva_to_offset(self, rva: int) -> Optional[int]:
+        for section in self.sections:
+            if section.rva <= rva < section.rva + max(section.virtual_size, section.raw_size):
+                offset = rva - section.rva
+                if offset < section.raw_size:
+                    return section.raw_offset + offset
+        return None
+
+    def function_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted (begin, end) RVA arrays from the .pdata RUNTIME_FUNCTION entries."""
+        if len(self.directories) <= EXCEPTION_DIRECTORY:
+            return np.empty(0, np.uint32), np.empty(0, np.uint32)
+        rva, size = self.directories[EXCEPTION_DIRECTORY]
+        offset = self.rva_to_offset(rva) if rva else None
+        if offset is None or size < 12:
+            return np.empty(0, np.uint32), np.empty(0, np.uint32)
+        entries = np.frombuffer(self.data, dtype='<u4', count=(size // 12) * 3, offset=offset).reshape(-1, 3)
+        order = np.argsort(entries[:, 0], kind='stable')
+        return entries[order, 0], entries[order, 1]
+
+
+def load_string_list(path: Path) -> List[str]:
+    """Read strings one per line, skipping the header extract_strings.py writes."""
+    lines = path.read_text(encoding='utf-8').splitlines()
+    if lines and lines[0].startswith('==='):
+        # Header block ends at the first blank line
+        lines = lines[lines.index('') + 1:] if '' in lines else []
+    return [line for line in lines if line.strip()]
+
+
+def is_text_unit(unit: int) -> bool:
+    """Whether a byte (or UTF-16 code unit) can be part of a diagnostic string."""
+    return 0x20 <= unit < 0x7F or unit in TEXT_CONTROL_CHARS
+
+
+def enclosing_string(blob: bytes, pos: int, size: int, width: int) -> Optional[Tuple[int, int]]:
+    """
+    Return (start, end) of the NUL-terminated string containing blob[pos:pos + size].
+
+    extract_strings.py strips whitespace and splits at control characters,
+    so a listed string may be the middle of a longer one; code references
+    point at the start of the enclosing string. Walks back over text
+    characters to the previous terminator and forward to the next one, in
+    steps of `width` bytes (1 for ASCII, 2 for UTF-16LE). Returns None if
+    the string is unterminated or embedded in non-text data.
+    """
+    def unit_at(offset: int) -> int:
+        return int.from_bytes(blob[offset:offset + width], 'little')
+
+    start = pos
+    while start >= width and is_text_unit(unit_at(start - width)):
+        start -= width
+    # A string starts right after a NUL byte. The last character of a
+    # preceding ASCII string plus its NUL also reads as a UTF-16 character,
+    # so step forward past anything that isn't
+    while start > 0 and blob[start - 1] != 0:
+        start += width
+        if start > pos:
+            return None
+
+    end = pos + size
+    while end + width <= len(blob) and is_text_unit(unit_at(end)):
+        end += width
+    if end + width > len(blob) or unit_at(end) != 0:
+        return None
+    return start, end
+
+
+def locate_strings(image: PEImage, strings: List[str]) -> List[dict]:
+    """
+    Find each string's occurrences (ASCII and UTF-16LE) in the data sections.
+
+    The RVA reported is the start of the enclosing string, with 'offset'
+    giving the byte offset of the listed text inside it.
+    """
+    located = []
+    data_sections = [s for s in image.sections if s.name in ('.rdata', '.data')]
+    blobs = [(s, image.section_bytes(s)) for s in data_sections]
+
+    for text in strings:
+        for encoding, needle, width in (
+            ('ascii', text.encode('latin-1', errors='ignore'), 1),
+            ('utf-16le', text.encode('utf-16-le'), 2),
+        ):
+            if not needle:
+                continue
+            for section, blob in blobs:
+                starts = set()
+                pos = blob.find(needle)
+                while pos >= 0:
+                    bounds = enclosing_string(blob, pos, len(needle), width)
+                    if bounds is not None and bounds[0] not in starts:
+                        starts.add(bounds[0])
+                        located.append({
+                            "text": text,
+                            "encoding": encoding,
+                            "rva": section.rva + bounds[0],
+                            "offset": pos - bounds[0],
+                        })
+                    pos = blob.find(needle, pos + 1)
+    return located
+
+
+def scan_rip_relative(image: PEImage, targets: np.ndarray) -> List[Tuple[int, int, str]]:
+    """
+    Find RIP-relative disp32 operands in .text that resolve to a target RVA.
+
+    Every byte offset is treated as a potential displacement at once:
+    target = rva_of_next_instruction + disp, assuming the displacement ends
+    the instruction (true for lea/mov reg, [rip+disp32]). Hits are kept when
+    the preceding ModRM byte encodes RIP-relative addressing.
+
+    Returns (site_rva, target_rva, kind) tuples, site being the opcode RVA.
+    """
+    text = image.section('.text')
+    if text is None or not len(targets):
+        return []
+    code = np.frombuffer(image.section_bytes(text), dtype=np.uint8)
+    sites = []
+
+    # Windows overlap by 3 bytes so every 4-byte displacement is seen once
+    for start in range(0, max(len(code) - 3, 0), CHUNK_SIZE):
+        window = code[start:start + CHUNK_SIZE + 3].astype(np.uint32)
+        if len(window) < 4:
+            break
+        disp = (window[:-3] | (window[1:-2] << 8) | (window[2:-1] << 16) | (window[3:] << 24)).view(np.int32)
+        positions = np.arange(start, start + len(disp), dtype=np.int64)
+        resolved = positions + text.rva + 4 + disp.astype(np.int64)
+
+        idx = np.searchsorted(targets, resolved)
+        idx[idx >= len(targets)] = len(targets) - 1
+        hits = np.nonzero((targets[idx] == resolved) & (positions >= 2))[0]
+
+        for hit in hits:
+            pos = int(positions[hit])
+            if (code[pos - 1] & MODRM_RIP_MASK) != MODRM_RIP:
+                continue
+            opcode = int(code[pos - 2])
+            kind = OPCODES.get(opcode, 'rip')
+            site = pos - 2
+            if kind != 'rip' and pos >= 3 and 0x48 <= code[pos - 3] <= 0x4F:
+                site = pos - 3  # REX.W prefix
+            sites.append((text.rva + site, int(resolved[hit]), kind))
+    return sites
+
+
+def scan_absolute_pointers(image: PEImage, targets: np.ndarray) -> List[Tuple[int, int]]:
+    """Find 8-byte aligned absolute pointers to target RVAs in the data sections."""
+    pointers = []
+    for section in image.sections:
+        if section.name not in ('.rdata', '.data'):
+            continue
+        blob = image.section_bytes(section)
+        values = np.frombuffer(blob, dtype='<u8', count=len(blob) // 8).astype(np.int64)
+        resolved = values - image.image_base
+        idx = np.searchsorted(targets, resolved)
+        idx[idx >= len(targets)] = len(targets) - 1
+        for hit in np.nonzero(targets[idx] == resolved)[0]:
+            pointers.append((section.rva + int(hit) * 8, int(resolved[hit])))
+    return pointers
+
+
+def group_tables(pointers: List[Tuple[int, int]]) -> List[Tuple[int, int, List[Tuple[int, int]]]]:
+    """Group pointer slots into tables of nearby entries: (start, end, (slot RVA, target RVA) pairs)."""
+    tables = []
+    for slot, target in sorted(pointers):
+        if tables and slot - tables[-1][1] <= TABLE_GAP:
+            tables[-1][1] = slot
+            tables[-1][2].append((slot, target))
+        else:
+            tables.append([slot, slot, [(slot, target)]])
+    return [(start, end + 8, entries) for start, end, entries in tables]
+
+
+def build_report(image: PEImage, strings: List[str]) -> dict:
+    """Locate strings, scan for references and cluster them by function and table."""
+    located = locate_strings(image, strings)
+    # Several listed strings can be parts of one enclosing string
+    texts_at: Dict[int, List[str]] = {}
+    for entry in located:
+        texts = texts_at.setdefault(entry['rva'], [])
+        if entry['text'] not in texts:
+            texts.append(entry['text'])
+    targets = np.array(sorted(texts_at), dtype=np.int64)
+
+    code_refs = scan_rip_relative(image, targets)
+    pointers = scan_absolute_pointers(image, targets)
+
+    begins, ends = image.function_table()
+    functions: Dict[str, dict] = {}
+    refs: Dict[int, list] = {}
+    for site, target, kind in code_refs:
+        idx = int(np.searchsorted(begins, site, side='right')) - 1
+        if idx >= 0 and site < int(ends[idx]):
+            key = f"0x{int(begins[idx]):08x}"
+            region = functions.setdefault(key, {
+                "start": key, "end": f"0x{int(ends[idx]):08x}", "strings": []
+            })
+        else:
+            key = None
+            region = functions.setdefault('unknown', {"start": None, "end": None, "strings": []})
+        for text in texts_at[target]:
+            if text not in region['strings']:
+                region['strings'].append(text)
+        refs.setdefault(target, []).append({"site": f"0x{site:08x}", "kind": kind, "function": key})
+
+    tables = []
+    for start, end, entries in group_tables(pointers):
+        table_strings = []
+        for slot, target in entries:
+            refs.setdefault(target, []).append(
+                {"site": f"0x{slot:08x}", "kind": "pointer", "table": f"0x{start:08x}"})
+            for text in texts_at[target]:
+                if text not in table_strings:
+                    table_strings.append(text)
+        tables.append({"start": f"0x{start:08x}", "end": f"0x{end:08x}", "strings": table_strings})
+
+    found = {entry['text'] for entry in located}
+    return {
+        "image_base": f"0x{image.image_base:x}",
+        "functions_in_pdata": int(len(begins)),
+        "strings": [
+            {"text": e['text'], "encoding": e['encoding'], "rva": f"0x{e['rva']:08x}", "offset": e['offset'],
+             "refs": refs.get(e['rva'], [])}
+            for e in sorted(located, key=lambda e: (e['rva'], e['offset']))
+        ],
+        "clusters": sorted(functions.values(), key=lambda c: -len(c['strings'])),
+        "tables": tables,
+        "not_found": [s for s in strings if s not in found],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Cross-reference diagnostic strings with the code that uses them',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Usage:')[1]
+    )
+    parser.add_argument('--exe', type=str, default=None,
+                        help='Path to the Workbench executable (auto-detected if not specified)')
+    parser.add_argument('--strings', type=str, default=str(REPO_ROOT / 'diagnostic_strings.txt'),
+                        help='Strings to locate, one per line (default: diagnostic_strings.txt in repository root)')
+    parser.add_argument('--output', type=str, default=str(REPO_ROOT / 'string_xrefs.json'),
+                        help='Output JSON file (default: string_xrefs.json in repository root)')
+    args = parser.parse_args()
+
+    exe_path = args.exe or get_path('workbench_exe')
+    if not exe_path:
+        print("Could not auto-detect the Workbench executable; pass --exe <path>")
+        sys.exit(1)
+    strings_path = Path(args.strings)
+    if not strings_path.exists():
+        print(f"Error: {strings_path} not found. Run scripts/extract_strings.py first.")
+        sys.exit(1)
+
+    print(f"Reading {exe_path}")
+    image = PEImage(Path(exe_path).read_bytes())
+    strings = load_string_list(strings_path)
+    print(f"Locating {len(strings)} strings and scanning for references...")
+
+    report = build_report(image, strings)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    referenced = sum(1 for s in report['strings'] if s['refs'])
+    print(f"Strings located: {len(report['strings'])} ({len(report['not_found'])} not found)")
+    print(f"Strings referenced: {referenced}")
+    print(f"Function clusters: {len(report['clusters'])}, pointer tables: {len(report['tables'])}")
+    print(f"Saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()